@@ -2,7 +2,9 @@ import functools
 import inspect
 import logging
 import re
+import string
 import unicodedata
+import weakref
 from typing import TYPE_CHECKING, Any, Dict, Iterable, Union
 
 from anyascii import anyascii
@@ -11,12 +13,12 @@ from django.conf import settings
 from django.conf.locale import LANG_INFO
 from django.core.exceptions import ImproperlyConfigured, SuspiciousOperation
 from django.core.signals import setting_changed
-from django.db.models import Model
+from django.db.models import Model, Q
 from django.db.models.base import ModelBase
 from django.dispatch import receiver
 from django.http import HttpRequest
 from django.utils.encoding import force_str
-from django.utils.text import capfirst, slugify
+from django.utils.text import capfirst
 from django.utils.translation import check_for_language, get_supported_language_variant
 
 if TYPE_CHECKING:
@@ -27,13 +29,16 @@ logger = logging.getLogger(__name__)
 WAGTAIL_APPEND_SLASH = getattr(settings, "WAGTAIL_APPEND_SLASH", True)
 
 
+# https://djangosnippets.org/snippets/585/
+CAMELCASE_RE = re.compile("(((?<=[a-z])[A-Z])|([A-Z](?![A-Z]|$)))")
+
+
+@functools.lru_cache(maxsize=1000)
 def camelcase_to_underscore(str):
-    # https://djangosnippets.org/snippets/585/
-    return (
-        re.sub("(((?<=[a-z])[A-Z])|([A-Z](?![A-Z]|$)))", "_\\1", str).lower().strip("_")
-    )
+    return CAMELCASE_RE.sub("_\\1", str).lower().strip("_")
 
 
+@functools.lru_cache(maxsize=1000)
 def string_to_ascii(value):
     """
     Convert a string to ascii.
@@ -101,6 +106,27 @@ def escape_script(text):
 
 SLUGIFY_RE = re.compile(r"[^\w\s-]", re.UNICODE)
 
+# Translation tables for slugifying ASCII bytes in a single pass: uppercase letters are
+# lowercased, and anything that SLUGIFY_RE would strip is deleted
+SLUGIFY_ASCII_TABLE = bytes.maketrans(
+    string.ascii_uppercase.encode("ascii"), string.ascii_lowercase.encode("ascii")
+)
+SLUGIFY_ASCII_DELETE = bytes(
+    c
+    for c in range(128)
+    if not (chr(c).isalnum() or chr(c).isspace() or chr(c) in "_-")
+)
+
+
+def _slugify_ascii(value):
+    """
+    Equivalent to Django's slugify for a string that is known to be pure ASCII
+    """
+    value = value.encode("ascii").translate(SLUGIFY_ASCII_TABLE, SLUGIFY_ASCII_DELETE)
+    # Collapse runs of whitespace and hyphens into single hyphens
+    value = "-".join(value.decode("ascii").replace("-", " ").split())
+    return value.strip("-_")
+
 
 def cautious_slugify(value):
     """
@@ -111,7 +137,16 @@ def cautious_slugify(value):
     This ensures that the result of slugifying (for example - Cyrillic) text will not be an empty
     string, and can thus be safely used as an identifier (albeit not a human-readable one).
     """
-    value = force_str(value)
+    # Lazy translation strings are resolved before hitting the cache, so that results
+    # are keyed on the text in the active language
+    return _cautious_slugify(force_str(value))
+
+
+@functools.lru_cache(maxsize=1000)
+def _cautious_slugify(value):
+    # Pure ASCII strings have nothing to escape, so the result is the same as slugify's
+    if value.isascii():
+        return _slugify_ascii(value)
 
     # Normalize the string to decomposed unicode form. This causes accented Latin
     # characters to be split into 'base character' + 'accent modifier'; the latter will
@@ -125,13 +160,13 @@ def cautious_slugify(value):
     value = SLUGIFY_RE.sub("", value)
 
     # Encode as ASCII, escaping non-ASCII characters with backslashreplace, then convert
-    # back to a unicode string (which is what slugify expects)
+    # back to a unicode string
     value = value.encode("ascii", "backslashreplace").decode("ascii")
 
-    # Pass to slugify to perform final conversion (whitespace stripping, applying
-    # mark_safe); this will also strip out the backslashes from the 'backslashreplace'
-    # conversion
-    return slugify(value)
+    # The string is now pure ASCII, so perform the final slugify conversion (lowercasing
+    # and whitespace stripping) without going back through regexps; this will also strip
+    # out the backslashes from the 'backslashreplace' conversion
+    return _slugify_ascii(value)
 
 
 def safe_snake_case(value):
@@ -163,10 +198,54 @@ def get_content_type_label(content_type):
         return capfirst(content_type.model)
 
 
+# Maps plain functions to (accepts **kwargs, names that can be passed by keyword, names that
+# can be passed by keyword once bound as a method). Keys are held weakly so that entries for
+# locally-defined functions go away with the function
+_accepted_kwargs_cache = weakref.WeakKeyDictionary()
+
+
+def _is_plain_function(func):
+    return (
+        inspect.isfunction(func)
+        and not hasattr(func, "__wrapped__")
+        and not hasattr(func, "__signature__")
+    )
+
+
 def accepts_kwarg(func, kwarg):
     """
     Determine whether the callable `func` has a signature that accepts the keyword argument `kwarg`
     """
+    is_method = inspect.ismethod(func)
+    function = func.__func__ if is_method else func
+
+    if _is_plain_function(function):
+        # For plain Python functions and methods bound to them, read the argument names
+        # straight off the code object rather than building a full Signature
+        try:
+            accepts_any_kwarg, kwarg_names, method_kwarg_names = _accepted_kwargs_cache[
+                function
+            ]
+        except KeyError:
+            code = function.__code__
+            accepts_any_kwarg = bool(code.co_flags & inspect.CO_VARKEYWORDS)
+            # positional-only arguments come first and can't be passed by keyword
+            first = getattr(code, "co_posonlyargcount", 0)
+            last = code.co_argcount + code.co_kwonlyargcount
+            kwarg_names = frozenset(code.co_varnames[first:last])
+            # binding a method supplies the first positional argument, if there is one
+            method_first = max(first, min(code.co_argcount, 1))
+            method_kwarg_names = frozenset(code.co_varnames[method_first:last])
+            _accepted_kwargs_cache[function] = (
+                accepts_any_kwarg,
+                kwarg_names,
+                method_kwarg_names,
+            )
+
+        if is_method:
+            kwarg_names = method_kwarg_names
+        return accepts_any_kwarg or kwarg in kwarg_names
+
     signature = inspect.signature(func)
     try:
         signature.bind_partial(**{kwarg: None})
@@ -227,7 +306,9 @@ def find_available_slug(parent, requested_slug, ignore_page_id=None):
     you can pass the page being updated here so the page's current slug is not
     treated as in use by another page.
     """
-    pages = parent.get_children().filter(slug__startswith=requested_slug)
+    pages = parent.get_children().filter(
+        Q(slug=requested_slug) | Q(slug__startswith=requested_slug + "-")
+    )
 
     if ignore_page_id:
         pages = pages.exclude(id=ignore_page_id)
@@ -338,9 +419,14 @@ def get_locales_display_names() -> dict:
 @receiver(setting_changed)
 def reset_cache(**kwargs):
     """
-    Clear cache when global WAGTAIL_CONTENT_LANGUAGES/LANGUAGES/LANGUAGE_CODE settings are changed
+    Clear cache when global WAGTAIL_CONTENT_LANGUAGES/LANGUAGES/LANGUAGE_CODE/USE_I18N settings are changed
     """
-    if kwargs["setting"] in ("WAGTAIL_CONTENT_LANGUAGES", "LANGUAGES", "LANGUAGE_CODE"):
+    if kwargs["setting"] in (
+        "WAGTAIL_CONTENT_LANGUAGES",
+        "LANGUAGES",
+        "LANGUAGE_CODE",
+        "USE_I18N",
+    ):
         get_content_languages.cache_clear()
         get_supported_content_language_variant.cache_clear()
 
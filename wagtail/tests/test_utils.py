@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*
+import gc
 import pickle
+import weakref
 
 from django.core.exceptions import ImproperlyConfigured, SuspiciousOperation
 from django.test import SimpleTestCase, TestCase, override_settings
@@ -9,6 +11,7 @@ from django.utils.translation import gettext_lazy as _
 
 from wagtail.coreutils import (
     InvokeViaAttributeShortcut,
+    _accepted_kwargs_cache,
     accepts_kwarg,
     camelcase_to_underscore,
     cautious_slugify,
@@ -32,7 +35,8 @@ class TestCamelCaseToUnderscore(TestCase):
         ]
 
         for (original, expected_result) in test_cases:
-            self.assertEqual(camelcase_to_underscore(original), expected_result)
+            with self.subTest(original=original):
+                self.assertEqual(camelcase_to_underscore(original), expected_result)
 
 
 class TestStringToAscii(TestCase):
@@ -53,7 +57,13 @@ class TestStringToAscii(TestCase):
         ]
 
         for (original, expected_result) in test_cases:
-            self.assertEqual(string_to_ascii(original), expected_result)
+            with self.subTest(original=original):
+                self.assertEqual(string_to_ascii(original), expected_result)
+
+    def test_returns_str_for_ascii_lazy_string(self):
+        result = string_to_ascii(_("Hello world"))
+        self.assertIs(type(result), str)
+        self.assertEqual(result, "Hello world")
 
 
 class TestCautiousSlugify(TestCase):
@@ -69,11 +79,19 @@ class TestCautiousSlugify(TestCase):
             ("Hello, world!", "hello-world"),
             ("Hello*world", "helloworld"),
             ("Hello☃world", "helloworld"),
+            ("Hello\tworld\n", "hello-world"),
+            ("Hello\r\n\x0bworld\x0c", "hello-world"),
+            ("Hello\x1c\x1d\x1e\x1fworld", "hello-world"),
+            ("--_foo_--", "foo"),
+            ("Hello - \t-world", "hello-world"),
+            ("_- Hello -_- world -_", "hello-_-world"),
         ]
 
         for (original, expected_result) in test_cases:
-            self.assertEqual(slugify(original), expected_result)
-            self.assertEqual(cautious_slugify(original), expected_result)
+            with self.subTest(original=original):
+                self.assertEqual(slugify(original), expected_result)
+                self.assertEqual(cautious_slugify(original), expected_result)
+                self.assertIs(type(cautious_slugify(original)), str)
 
     def test_escapes_non_latin_chars(self):
         test_cases = [
@@ -83,7 +101,9 @@ class TestCautiousSlugify(TestCase):
         ]
 
         for (original, expected_result) in test_cases:
-            self.assertEqual(cautious_slugify(original), expected_result)
+            with self.subTest(original=original):
+                self.assertEqual(cautious_slugify(original), expected_result)
+                self.assertIs(type(cautious_slugify(original)), str)
 
 
 class TestSafeSnakeCase(TestCase):
@@ -112,7 +132,8 @@ class TestSafeSnakeCase(TestCase):
         ]
 
         for (original, expected_result) in test_cases:
-            self.assertEqual(safe_snake_case(original), expected_result)
+            with self.subTest(original=original):
+                self.assertEqual(safe_snake_case(original), expected_result)
 
     def test_strings_with__non_latin_chars(self):
         test_cases = [
@@ -121,7 +142,8 @@ class TestSafeSnakeCase(TestCase):
         ]
 
         for (original, expected_result) in test_cases:
-            self.assertEqual(safe_snake_case(original), expected_result)
+            with self.subTest(original=original):
+                self.assertEqual(safe_snake_case(original), expected_result)
 
 
 class TestAcceptsKwarg(TestCase):
@@ -135,9 +157,56 @@ class TestAcceptsKwarg(TestCase):
         def func_with_kwargs(apple, **kwargs):
             pass
 
+        def func_with_keyword_only_banana(apple, *args, banana=42):
+            pass
+
+        class Fruit:
+            def method_without_banana(self, apple, orange=42):
+                pass
+
+            def method_with_banana(self, banana=42):
+                pass
+
+            @classmethod
+            def classmethod_with_banana(cls, banana=42):
+                pass
+
         self.assertFalse(accepts_kwarg(func_without_banana, "banana"))
         self.assertTrue(accepts_kwarg(func_with_banana, "banana"))
         self.assertTrue(accepts_kwarg(func_with_kwargs, "banana"))
+        self.assertTrue(accepts_kwarg(func_with_keyword_only_banana, "banana"))
+        self.assertFalse(accepts_kwarg(func_with_keyword_only_banana, "args"))
+        self.assertTrue(accepts_kwarg(Fruit().method_with_banana, "banana"))
+        self.assertFalse(accepts_kwarg(Fruit().method_with_banana, "self"))
+        self.assertFalse(accepts_kwarg(Fruit().method_without_banana, "banana"))
+        self.assertTrue(accepts_kwarg(Fruit.classmethod_with_banana, "banana"))
+        self.assertFalse(accepts_kwarg(Fruit.classmethod_with_banana, "cls"))
+        # unbound functions accessed through the class still accept the first argument
+        self.assertTrue(accepts_kwarg(Fruit.method_with_banana, "self"))
+
+    def test_does_not_keep_functions_alive(self):
+        def func_with_banana(apple, banana=42):
+            pass
+
+        self.assertTrue(accepts_kwarg(func_with_banana, "banana"))
+        func_ref = weakref.ref(func_with_banana)
+        del func_with_banana
+        gc.collect()
+        self.assertIsNone(func_ref())
+
+    def test_bound_methods_cached_on_underlying_function(self):
+        class Fruit:
+            def method_with_banana(self, banana=42):
+                pass
+
+        self.assertTrue(accepts_kwarg(Fruit().method_with_banana, "banana"))
+        func = Fruit.__dict__["method_with_banana"]
+        self.assertIn(func, _accepted_kwargs_cache)
+
+        func_ref = weakref.ref(func)
+        del Fruit, func
+        gc.collect()
+        self.assertIsNone(func_ref())
 
 
 class TestTargetClass:
@@ -188,11 +257,12 @@ class TestInvokeViaAttributeShortcut(SimpleTestCase):
 
 
 class TestFindAvailableSlug(TestCase):
-    def setUp(self):
-        self.root_page = Page.objects.get(depth=1)
-        self.home_page = Page.objects.get(depth=2)
+    @classmethod
+    def setUpTestData(cls):
+        cls.root_page = Page.objects.get(depth=1)
+        cls.home_page = Page.objects.get(depth=2)
 
-        self.second_home_page = self.root_page.add_child(
+        cls.second_home_page = cls.root_page.add_child(
             instance=Page(title="Second homepage", slug="home-1")
         )
 
@@ -294,6 +364,28 @@ class TestGetContentLanguages(TestCase):
             ),
         )
 
+    @override_settings(
+        LANGUAGES=[
+            ("en-gb", "British English"),
+        ],
+        WAGTAIL_CONTENT_LANGUAGES=None,
+        LANGUAGE_CODE="en-us",
+    )
+    def test_recomputed_when_use_i18n_changes(self):
+        # With i18n enabled, en-us resolves to the only available English variant
+        self.assertEqual(get_content_languages(), {"en-gb": "British English"})
+
+        try:
+            # Need to forcibly clear the django.utils.translation._trans object when
+            # overriding USE_I18N
+            _trans.__dict__.clear()
+            with override_settings(USE_I18N=False):
+                # The 'null' translation backend returns en-us unchanged, which falls back
+                # on the generic 'en' with no display name available
+                self.assertEqual(get_content_languages(), {"en": "en-us"})
+        finally:
+            _trans.__dict__.clear()
+
 
 @override_settings(
     USE_I18N=True,